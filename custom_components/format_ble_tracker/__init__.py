@@ -19,18 +19,49 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import (
+    ADAPTIVE_MIN_EXPIRATION,
+    ADAPTIVE_MISSED_INTERVALS,
     ALIVE_NODES_TOPIC,
     DOMAIN,
+    HMM_MAX_STAY_PROBABILITY,
+    HMM_RSSI_SCALE,
+    HMM_STAY_PROBABILITY,
+    LATENCY,
+    LOAD_LEVEL_NO_ATTRIBUTES,
+    LOAD_LEVEL_SAMPLING,
+    LOAD_LEVEL_TRANSITIONS_ONLY,
+    LOAD_MONITOR,
+    LOAD_SAMPLE_INTERVAL,
     MAC,
     MERGE_IDS,
     NAME,
+    OCCUPANCY,
     ROOM,
     ROOT_TOPIC,
     RSSI,
+    SEQUENCE,
     TIMESTAMP,
 )
+from .adverts import AdvertIntervalEstimator, AdvertOrderState
+from .hmm import RoomHmm
+from .load import EventLoopLagMonitor
+from .occupancy import RoomOccupancyIndex
+from .tracing import (
+    STAGE_DECODE,
+    STAGE_FILTER,
+    STAGE_STATE_WRITE,
+    STAGE_TOTAL,
+    STAGE_TRANSPORT,
+    LatencyHistogram,
+    LatencyTracer,
+)
 
-PLATFORMS: list[Platform] = [Platform.DEVICE_TRACKER, Platform.SENSOR, Platform.NUMBER]
+PLATFORMS: list[Platform] = [
+    Platform.DEVICE_TRACKER,
+    Platform.SENSOR,
+    Platform.NUMBER,
+    Platform.SWITCH,
+]
 _LOGGER = logging.getLogger(__name__)
 
 MQTT_PAYLOAD = vol.Schema(
@@ -40,6 +71,7 @@ MQTT_PAYLOAD = vol.Schema(
             {
                 vol.Required(RSSI): vol.Coerce(int),
                 vol.Optional(TIMESTAMP): vol.Coerce(int),
+                vol.Optional(SEQUENCE): vol.Coerce(int),
             },
             extra=vol.ALLOW_EXTRA,
         ),
@@ -51,13 +83,32 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Format BLE Tracker from a config entry."""
 
     hass.data.setdefault(DOMAIN, {})
+    occupancy = hass.data[DOMAIN].setdefault(OCCUPANCY, RoomOccupancyIndex())
+    hass.data[DOMAIN].setdefault(LATENCY, LatencyTracer())
+    load_monitor = hass.data[DOMAIN].setdefault(
+        LOAD_MONITOR, EventLoopLagMonitor(hass)
+    )
 
     if MAC in entry.data:
         mac = entry.data[MAC]
-        coordinator = BeaconCoordinator(hass, entry.data)
+        coordinator = BeaconCoordinator(
+            hass,
+            entry.data,
+            occupancy,
+            LatencyTracer(hass.data[DOMAIN][LATENCY]),
+            load_monitor,
+        )
+        entry.async_on_unload(
+            load_monitor.async_add_listener(coordinator.on_load_level_changed)
+        )
         state_topic = ROOT_TOPIC + "/" + mac + "/+"
         _LOGGER.info("Subscribing to %s", state_topic)
-        await mqtt.async_subscribe(hass, state_topic, coordinator.message_received, 1)
+        entry.async_on_unload(
+            await mqtt.async_subscribe(
+                hass, state_topic, coordinator.message_received, 1
+            )
+        )
+        entry.async_on_unload(coordinator.async_stop)
         alive_topic = ALIVE_NODES_TOPIC + "/" + mac
         _LOGGER.info("Notifying alive to %s", alive_topic)
         await mqtt.async_publish(hass, alive_topic, True, 1, retain=True)
@@ -97,9 +148,18 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 class BeaconCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Class to arrange interaction with MQTT."""
 
-    def __init__(self, hass: HomeAssistant, data) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        data,
+        occupancy: RoomOccupancyIndex,
+        tracer: LatencyTracer,
+        load_monitor: EventLoopLagMonitor,
+    ) -> None:
         """Initialise coordinator."""
         self.mac = data[MAC]
+        self.occupancy = occupancy
+        self.stopped = False
         self.expiration_time: int
         self.min_rssi: int
         self.default_expiration_time: int = 2
@@ -109,19 +169,39 @@ class BeaconCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.filtered_room_data = dict[str, int]()
         self.room_filters = dict[str, KalmanFilter]()
         self.room_expiration_timers = dict[str, asyncio.TimerHandle]()
+        self.room_intervals = dict[str, AdvertIntervalEstimator]()
+        self.room_adv_order = dict[str, AdvertOrderState]()
+        self.dropped_duplicates = 0
+        self.dropped_stale = 0
+        self.adaptive_expiration = False
         self.room: str | None = None
         self.last_received_adv_time = None
         self.time_from_previous = None
+        self.tracer = tracer
+        self.tracing_enabled = False
+        self.room_engine = RoomHmm(
+            HMM_STAY_PROBABILITY, HMM_MAX_STAY_PROBABILITY, HMM_RSSI_SCALE
+        )
+        self.room_engine_enabled = False
+        self.room_engine_cost = LatencyHistogram()
+        self.room_change_lag = LatencyHistogram()
+        self.argmax_room: str | None = None
+        self.argmax_changed_at = 0.0
+        self.argmax_room_changes = 0
+        self.room_engine_room_changes = 0
+        self.load_monitor = load_monitor
+        self.room_sampled_at = dict[str, float]()
+        self.room_deferred_seen = dict[str, float]()
 
         super().__init__(hass, _LOGGER, name=given_name)
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Update data via library."""
         if len(self.filtered_room_data) == 0:
-            self.room = None
+            room = None
             self.last_received_adv_time = None
         else:
-            self.room = next(
+            room = next(
                 iter(
                     dict(
                         sorted(
@@ -132,22 +212,73 @@ class BeaconCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     )
                 )
             )
+        if self.room_engine_enabled:
+            argmax_room = room
+            if self.room_engine.room in self.filtered_room_data:
+                room = self.room_engine.room
+            self.evaluate_room_engine(argmax_room, room)
+        self.room = room
+        if not self.stopped:
+            self.occupancy.async_move(self.mac, self.name, self.room)
         return {**{ROOM: self.room}}
 
+    def evaluate_room_engine(self, argmax_room: str | None, room: str | None):
+        """Compare room engine decision with strongest signal room.
+
+        Delay of room engine is recorded, when it switches to the room,
+        which is already the strongest one.
+        """
+        now = self.hass.loop.time()
+        if argmax_room != self.argmax_room:
+            self.argmax_room = argmax_room
+            self.argmax_changed_at = now
+            self.argmax_room_changes += 1
+        if room != self.room:
+            self.room_engine_room_changes += 1
+            if room is not None and room == argmax_room:
+                self.room_change_lag.record((now - self.argmax_changed_at) * 1000)
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop expiration timers and leave occupancy index on unload."""
+        self.stopped = True
+        for timer in self.room_expiration_timers.values():
+            timer.cancel()
+        self.occupancy.async_remove_beacon(self.mac)
+
     async def subscribe_to_mqtt(self) -> None:
         """Subscribe coordinator to MQTT messages."""
 
     @callback
     async def message_received(self, msg):
         """Handle new MQTT messages."""
+        received = time.perf_counter()
+        room_topic = msg.topic.split("/")[2]
+        received_time = time.time()
+        current_time = int(received_time)
         try:
             data = MQTT_PAYLOAD(msg.payload)
         except vol.MultipleInvalid as error:
             _LOGGER.debug("Skipping malformed message: %s", error)
             return
+        if self.tracing_enabled:
+            self.tracer.record(STAGE_DECODE, (time.perf_counter() - received) * 1000)
         msg_time = data.get(TIMESTAMP)
+        order = self.room_adv_order.get(room_topic)
+        if order is None:
+            order = AdvertOrderState()
+            self.room_adv_order[room_topic] = order
+        verdict = order.check(
+            data.get(SEQUENCE), msg_time, data.get(RSSI), self.get_expiration_time()
+        )
+        if verdict is not AdvertOrderState.ACCEPTED:
+            if verdict is AdvertOrderState.DUPLICATE:
+                self.dropped_duplicates += 1
+            else:
+                self.dropped_stale += 1
+            _LOGGER.debug("Skipping %s message from %s", verdict, room_topic)
+            return
         if msg_time is not None:
-            current_time = int(time.time())
             if current_time - msg_time >= self.get_expiration_time():
                 _LOGGER.info("Skipping message with old timestamp")
                 return
@@ -155,6 +286,13 @@ class BeaconCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         if rssi < self.get_min_rssi():
             _LOGGER.info("Skipping message with low RSSI (%s)", rssi)
             return
+        # Node timestamp is not affected by buffering on the way to HA.
+        # Estimate is cheap and must see shed adverts too, to stay correct.
+        self.get_interval_estimator(room_topic).update(
+            self.hass.loop.time() if msg_time is None else msg_time
+        )
+        if self.load_level >= LOAD_LEVEL_SAMPLING and self.shed_advert(room_topic):
+            return
         self.time_from_previous = (
             None
             if self.last_received_adv_time is None
@@ -162,22 +300,80 @@ class BeaconCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         )
         self.last_received_adv_time = current_time
 
-        room_topic = msg.topic.split("/")[2]
-
         await self.schedule_data_expiration(room_topic)
 
         self.room_data[room_topic] = rssi
         self.filtered_room_data[room_topic] = self.get_filtered_value(room_topic, rssi)
+        if self.room_engine_enabled:
+            engine_started = time.perf_counter()
+            self.room_engine.update(room_topic, self.filtered_room_data[room_topic])
+            self.room_engine_cost.record(
+                (time.perf_counter() - engine_started) * 1000
+            )
+        if self.tracing_enabled:
+            self.tracer.record(STAGE_FILTER, (time.perf_counter() - received) * 1000)
 
         await self.async_refresh()
+        if self.tracing_enabled:
+            # Entities write their state synchronously from refresh listeners,
+            # unless load shedding makes them skip writes.
+            self.trace_state_written(
+                received,
+                msg_time,
+                received_time,
+                self.load_level < LOAD_LEVEL_NO_ATTRIBUTES,
+            )
+        self.load_monitor.record_processing((time.perf_counter() - received) * 1000)
 
-    async def schedule_data_expiration(self, room):
+    def shed_advert(self, room) -> bool:
+        """Decide, if valid advert should be skipped because of high load.
+
+        Filtering, timers and refresh are skipped, but adverts from rooms
+        without data are always processed, so beacon still goes home or
+        changes room. Skipped adverts only postpone room data expiration.
+        """
+        if room not in self.room_data:
+            return False
+        now = self.hass.loop.time()
+        self.room_deferred_seen[room] = now
+        if self.load_level >= LOAD_LEVEL_TRANSITIONS_ONLY:
+            return True
+        if now - self.room_sampled_at.get(room, 0.0) < LOAD_SAMPLE_INTERVAL:
+            return True
+        self.room_sampled_at[room] = now
+        return False
+
+    @property
+    def load_level(self) -> int:
+        """Return current load shedding level."""
+        return self.load_monitor.level
+
+    @callback
+    def on_load_level_changed(self):
+        """Respond to load shedding level change, refreshing entities."""
+        self.async_update_listeners()
+
+    def trace_state_written(
+        self, received: float, msg_time, received_time: float, written: bool
+    ):
+        """Record latencies of reading, which reached entities state."""
+        handled = (time.perf_counter() - received) * 1000
+        if written:
+            self.tracer.record(STAGE_STATE_WRITE, handled)
+        if msg_time is not None:
+            # Node timestamp is truncated to whole seconds, take middle of the second
+            transport = max(0.0, received_time - msg_time - 0.5) * 1000
+            self.tracer.record(STAGE_TRANSPORT, transport)
+            if written:
+                self.tracer.record(STAGE_TOTAL, transport + handled)
+
+    async def schedule_data_expiration(self, room, delay=None):
         """Start timer for data expiration for certain room."""
         if room in self.room_expiration_timers:
             self.room_expiration_timers[room].cancel()
         loop = asyncio.get_event_loop()
         timer = loop.call_later(
-            self.get_expiration_time(),
+            self.get_room_expiration_time(room) if delay is None else delay,
             lambda: asyncio.ensure_future(self.expire_data(room)),
         )
         self.room_expiration_timers[room] = timer
@@ -196,16 +392,49 @@ class BeaconCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Calculate current expiration delay."""
         return getattr(self, "expiration_time", self.default_expiration_time) * 60
 
+    def get_interval_estimator(self, room) -> AdvertIntervalEstimator:
+        """Get advertisement interval estimator for room."""
+        if room in self.room_intervals:
+            return self.room_intervals[room]
+        estimator = AdvertIntervalEstimator()
+        self.room_intervals[room] = estimator
+        return estimator
+
+    def get_room_expiration_time(self, room):
+        """Calculate expiration delay for certain room.
+
+        In adaptive mode, room expires after several missed advertisements,
+        but never later than user-defined expiration delay.
+        """
+        expiration_time = self.get_expiration_time()
+        if not self.adaptive_expiration or room not in self.room_intervals:
+            return expiration_time
+        timeout = self.room_intervals[room].timeout(ADAPTIVE_MISSED_INTERVALS)
+        if timeout is None:
+            return expiration_time
+        return min(expiration_time, max(ADAPTIVE_MIN_EXPIRATION, timeout))
+
     def get_min_rssi(self):
         """Calculate current minimum RSSI to take."""
         return getattr(self, "min_rssi", self.default_min_rssi)
 
     async def expire_data(self, room):
         """Set data for certain room expired."""
+        seen = self.room_deferred_seen.pop(room, None)
+        if seen is not None:
+            remaining = (
+                seen + self.get_room_expiration_time(room) - self.hass.loop.time()
+            )
+            if remaining > 0:
+                await self.schedule_data_expiration(room, remaining)
+                return
         del self.room_data[room]
         del self.filtered_room_data[room]
         del self.room_filters[room]
         del self.room_expiration_timers[room]
+        self.room_intervals.pop(room, None)
+        self.room_adv_order.pop(room, None)
+        self.room_engine.remove(room)
         await self.async_refresh()
 
     async def on_expiration_time_changed(self, new_time: int):
@@ -222,6 +451,26 @@ class BeaconCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             return
         self.min_rssi = new_min_rssi
 
+    async def on_adaptive_expiration_changed(self, enabled: bool):
+        """Respond to adaptive expiration switched by user."""
+        self.adaptive_expiration = enabled
+        for room in self.room_expiration_timers.keys():
+            await self.schedule_data_expiration(room)
+
+    async def on_room_engine_changed(self, enabled: bool):
+        """Respond to probabilistic room engine switched by user."""
+        if enabled == self.room_engine_enabled:
+            return
+        self.room_engine_enabled = enabled
+        if enabled:
+            self.room_engine.reset(self.filtered_room_data)
+            self.argmax_room = self.room
+        await self.async_refresh()
+
+    async def on_tracing_changed(self, enabled: bool):
+        """Respond to latency tracing switched by user."""
+        self.tracing_enabled = enabled
+
 
 class KalmanFilter:
     """Filtering RSSI data."""
@@ -0,0 +1,148 @@
+"""Advert ordering and interval tracking implementation."""
+from __future__ import annotations
+
+import math
+
+
+class AdvertOrderState:
+    """Ordering state of adverts from one node, to drop duplicates and stale ones.
+
+    With node sequence number, a sliding bitmask of recently seen numbers
+    lets slightly reordered adverts through, while redelivered ones are dropped.
+    Backward jump beyond the window, or lower number with newer timestamp,
+    means node restart.
+
+    Without it, adverts with timestamp older than the latest are dropped,
+    and so is repeated latest advert (same timestamp and RSSI). Timestamp
+    has only seconds precision, so redelivery of earlier advert within
+    the same second can not be detected without sequence number.
+    Large backward timestamp jump is treated as clock correction.
+    """
+
+    __slots__ = ("last_seq", "seen_mask", "last_timestamp", "last_rssi")
+
+    ACCEPTED = "accepted"
+    DUPLICATE = "duplicate"
+    STALE = "stale"
+
+    window = 64
+    window_mask = (1 << window) - 1
+
+    def __init__(self):
+        """Initialize state."""
+        self.last_seq: int | None = None
+        self.seen_mask = 0
+        self.last_timestamp: int | None = None
+        self.last_rssi: int | None = None
+
+    def check(
+        self, seq: int | None, timestamp: int | None, rssi: int, max_gap: int
+    ) -> str:
+        """Check advert and remember it, if accepted.
+
+        :param max_gap: Backward timestamp jump (seconds), treated as clock correction
+        """
+        if seq is not None:
+            verdict = self._check_seq(seq, timestamp)
+        else:
+            verdict = self._check_timestamp(timestamp, rssi, max_gap)
+        if verdict is self.ACCEPTED:
+            if timestamp is not None and (
+                self.last_timestamp is None or timestamp >= self.last_timestamp
+            ):
+                self.last_timestamp = timestamp
+            self.last_rssi = rssi
+        return verdict
+
+    def _check_timestamp(self, timestamp: int | None, rssi: int, max_gap: int) -> str:
+        if timestamp is None or self.last_timestamp is None:
+            return self.ACCEPTED
+        if timestamp == self.last_timestamp and rssi == self.last_rssi:
+            return self.DUPLICATE
+        if self.last_timestamp - max_gap <= timestamp < self.last_timestamp:
+            return self.STALE
+        if timestamp < self.last_timestamp:
+            # Node clock was corrected
+            self.last_timestamp = timestamp
+        return self.ACCEPTED
+
+    def _check_seq(self, seq: int, timestamp: int | None) -> str:
+        if self.last_seq is None:
+            self._restart(seq)
+            return self.ACCEPTED
+        diff = seq - self.last_seq
+        if diff > 0:
+            if diff >= self.window:
+                self.seen_mask = 1
+            else:
+                self.seen_mask = ((self.seen_mask << diff) | 1) & self.window_mask
+            self.last_seq = seq
+            return self.ACCEPTED
+        age = -diff
+        if age >= self.window or (
+            age > 0
+            and timestamp is not None
+            and self.last_timestamp is not None
+            and timestamp > self.last_timestamp
+        ):
+            # Node restarted or counter wrapped around
+            self._restart(seq)
+            return self.ACCEPTED
+        if self.seen_mask >> age & 1:
+            return self.DUPLICATE
+        self.seen_mask |= 1 << age
+        return self.ACCEPTED
+
+    def _restart(self, seq: int) -> None:
+        self.last_seq = seq
+        self.seen_mask = 1
+
+
+class AdvertIntervalEstimator:
+    """Running estimate of advertisement interval and its variance.
+
+    Intervals much shorter than current estimate come from adverts,
+    buffered by node and delivered in a burst, and are ignored.
+    Zero intervals (adverts within the same second of node timestamp)
+    are not counted at all.
+    """
+
+    alpha = 0.2
+    warm_up = 5
+    burst_ratio = 0.25
+
+    def __init__(self):
+        """Initialize estimator."""
+        self.last_time: float | None = None
+        self.samples = 0
+        self.mean = 0.0
+        self.variance = 0.0
+
+    def update(self, now: float):
+        """Account advertisement received at given time (in seconds)."""
+        if self.last_time is not None:
+            interval = now - self.last_time
+            if interval <= 0:
+                return
+            if self.samples >= self.warm_up and interval < self.burst_ratio * self.mean:
+                self.last_time = now
+                return
+            if self.samples == 0:
+                self.mean = interval
+            else:
+                # Exponentially weighted mean and variance
+                diff = interval - self.mean
+                incr = self.alpha * diff
+                self.mean += incr
+                self.variance = (1 - self.alpha) * (self.variance + diff * incr)
+            self.samples += 1
+        self.last_time = now
+
+    def timeout(self, missed_intervals: int) -> float | None:
+        """Return time to wait for given count of missed intervals.
+
+        :return: Timeout in seconds, or None, if estimate is not ready yet
+        """
+        if self.samples < self.warm_up:
+            return None
+        return missed_intervals * self.mean + 2 * math.sqrt(self.variance)
@@ -13,9 +13,25 @@ ROOT_TOPIC = "format_ble_tracker"
 ALIVE_NODES_TOPIC = ROOT_TOPIC + "/alive"
 RSSI = "rssi"
 TIMESTAMP = "timestamp"
+SEQUENCE = "seq"
 MERGE_IDS = "merge_ids"
 ENTITY_ID = "entity_id"
 NEW_STATE = "new_state"
 MERGE_LOGIC = "merge_logic"
 AWAY_WHEN_OR = "home_when_and"
 AWAY_WHEN_AND = "home_when_or"
+OCCUPANCY = "occupancy"
+OCCUPANTS_SHOWN = 5
+LATENCY = "latency"
+ADAPTIVE_MISSED_INTERVALS = 3
+ADAPTIVE_MIN_EXPIRATION = 5
+HMM_STAY_PROBABILITY = 0.95
+HMM_MAX_STAY_PROBABILITY = 0.99
+HMM_RSSI_SCALE = 6
+LOAD_MONITOR = "load_monitor"
+LOAD_LEVEL_NORMAL = 0
+LOAD_LEVEL_NO_ATTRIBUTES = 1
+LOAD_LEVEL_SAMPLING = 2
+LOAD_LEVEL_TRANSITIONS_ONLY = 3
+LOAD_LEVELS = ["normal", "no_attributes", "sampling", "transitions_only"]
+LOAD_SAMPLE_INTERVAL = 5
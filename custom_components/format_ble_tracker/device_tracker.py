@@ -16,6 +16,7 @@ from .const import (
     AWAY_WHEN_OR,
     DOMAIN,
     ENTITY_ID,
+    LOAD_LEVEL_NO_ATTRIBUTES,
     MERGE_IDS,
     MERGE_LOGIC,
     NAME,
@@ -58,6 +59,7 @@ class BleDeviceTracker(BeaconDeviceEntity, BaseTrackerEntity):
         self._attr_name = coordinator.name + " tracker"
         self._attr_unique_id = self.formatted_mac_address + "_tracker"
         self.entity_id = f"{device_tracker.DOMAIN}.{self._attr_unique_id}"
+        self.written_state: str | None = None
 
     @property
     def source_type(self) -> str:
@@ -74,6 +76,13 @@ class BleDeviceTracker(BeaconDeviceEntity, BaseTrackerEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle data update."""
+        state = self.state
+        if (
+            self.coordinator.load_level >= LOAD_LEVEL_NO_ATTRIBUTES
+            and state == self.written_state
+        ):
+            return
+        self.written_state = state
         self.async_write_ha_state()
 
 
@@ -0,0 +1,36 @@
+"""Diagnostics support for Format BLE Tracker."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, LATENCY, LOAD_LEVELS, LOAD_MONITOR
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    data: dict[str, Any] = {
+        "latency_global_ms": hass.data[DOMAIN][LATENCY].as_dict(),
+        "load": hass.data[DOMAIN][LOAD_MONITOR].as_dict(),
+    }
+    if entry.entry_id in hass.data[DOMAIN]:
+        coordinator = hass.data[DOMAIN][entry.entry_id]
+        data["load_shedding"] = LOAD_LEVELS[coordinator.load_level]
+        data["latency_tracing"] = coordinator.tracing_enabled
+        data["latency_ms"] = coordinator.tracer.as_dict()
+        data["dropped_adverts"] = {
+            "duplicate": coordinator.dropped_duplicates,
+            "stale": coordinator.dropped_stale,
+        }
+        data["room_engine"] = {
+            "enabled": coordinator.room_engine_enabled,
+            "update_cost_ms": coordinator.room_engine_cost.as_dict(),
+            "room_change_delay_ms": coordinator.room_change_lag.as_dict(),
+            "room_changes": coordinator.room_engine_room_changes,
+            "strongest_room_changes": coordinator.argmax_room_changes,
+        }
+    return data
@@ -0,0 +1,193 @@
+"""Probabilistic room decision engine implementation."""
+from __future__ import annotations
+
+import math
+
+NEG_INF = float("-inf")
+
+
+class RoomHmm:
+    """Hidden Markov model over rooms, decoded with incremental Viterbi.
+
+    Hidden state is the room, where beacon actually is. Emission model
+    is a softmax over filtered RSSI values of all rooms, so the room
+    with the strongest signal is most likely, but not certain.
+    Transitions keep learned probability of staying in each room,
+    leaving probability is spread evenly over other rooms. That makes
+    every update O(rooms) over preallocated arrays.
+
+    Transitions are learned from the decoded path itself, so counts never
+    drop below prior ones, and stay probability is capped: otherwise long
+    dwell in one room would make the engine ever slower to follow moves.
+    """
+
+    initial_capacity = 16
+    max_learned_steps = 10000
+    prior_steps = 10
+
+    def __init__(
+        self,
+        stay_probability: float,
+        max_stay_probability: float,
+        rssi_scale: float,
+    ):
+        """Initialize model.
+
+        :param stay_probability: Prior probability to stay in the room between readings
+        :param max_stay_probability: Upper limit for learned stay probability
+        :param rssi_scale: RSSI difference (dB), making room e times less likely
+        """
+        self.stay_probability = stay_probability
+        self.max_stay_probability = max_stay_probability
+        self.rssi_scale = rssi_scale
+        self.prior_stays = stay_probability * self.prior_steps
+        self.prior_leaves = self.prior_steps - self.prior_stays
+        self.rooms = list[str]()
+        self.room_index = dict[str, int]()
+        self.size = 0
+        self.capacity = 0
+        self.active = list[bool]()
+        self.scores = list[float]()
+        self.rssi = list[float]()
+        self.stays = list[float]()
+        self.leaves = list[float]()
+        self.best: int | None = None
+        self._grow(self.initial_capacity)
+
+    @property
+    def room(self) -> str | None:
+        """Return end state of most likely rooms path."""
+        return None if self.best is None else self.rooms[self.best]
+
+    def _grow(self, capacity: int) -> None:
+        extra = capacity - self.capacity
+        self.active.extend([False] * extra)
+        self.scores.extend([NEG_INF] * extra)
+        self.rssi.extend([0.0] * extra)
+        self.stays.extend([self.prior_stays] * extra)
+        self.leaves.extend([self.prior_leaves] * extra)
+        self.capacity = capacity
+
+    def _get_index(self, room: str) -> int:
+        if room in self.room_index:
+            return self.room_index[room]
+        if self.size == self.capacity:
+            self._grow(self.capacity * 2)
+        index = self.size
+        self.rooms.append(room)
+        self.room_index[room] = index
+        self.size += 1
+        return index
+
+    def stay_probability_of(self, index: int) -> float:
+        """Return learned probability to stay in room with given index."""
+        stays = self.stays[index]
+        return min(self.max_stay_probability, stays / (stays + self.leaves[index]))
+
+    def reset(self, room_rssi: dict[str, int]) -> None:
+        """Start decoding from scratch with given RSSI values."""
+        for i in range(self.size):
+            self.active[i] = False
+            self.scores[i] = NEG_INF
+        for room, rssi in room_rssi.items():
+            index = self._get_index(room)
+            self.active[index] = True
+            self.rssi[index] = rssi
+            self.scores[index] = 0.0
+        self._emit()
+
+    def remove(self, room: str) -> None:
+        """Mark room as having no data."""
+        if room not in self.room_index:
+            return
+        index = self.room_index[room]
+        self.active[index] = False
+        self.scores[index] = NEG_INF
+        if self.best == index:
+            self._select_best()
+
+    def update(self, room: str, rssi: int) -> str | None:
+        """Account new filtered RSSI reading for room, return decoded room."""
+        index = self._get_index(room)
+        self.active[index] = True
+        self.rssi[index] = rssi
+        active = self.active
+        scores = self.scores
+
+        # Best and second best predecessors for transitions between rooms
+        first = second = NEG_INF
+        first_index = -1
+        others = 0
+        for i in range(self.size):
+            if active[i]:
+                others += 1
+        log_others = math.log(others - 1) if others > 1 else 0.0
+        for i in range(self.size):
+            score = scores[i]
+            if score == NEG_INF:
+                continue
+            leave = score + math.log(1 - self.stay_probability_of(i)) - log_others
+            if leave > first:
+                second = first
+                first = leave
+                first_index = i
+            elif leave > second:
+                second = leave
+        for j in range(self.size):
+            if not active[j]:
+                continue
+            score = scores[j]
+            stay = (
+                NEG_INF
+                if score == NEG_INF
+                else score + math.log(self.stay_probability_of(j))
+            )
+            enter = second if j == first_index else first
+            scores[j] = stay if stay > enter else enter
+        if scores[index] == NEG_INF:
+            # No other rooms to come from, start path here
+            scores[index] = 0.0
+
+        previous = self.best
+        self._emit()
+        self._learn(previous)
+        return self.room
+
+    def _emit(self) -> None:
+        """Apply emission probabilities and normalize scores."""
+        active = self.active
+        scores = self.scores
+        rssi = self.rssi
+        max_rssi = NEG_INF
+        for i in range(self.size):
+            if active[i] and rssi[i] > max_rssi:
+                max_rssi = rssi[i]
+        for i in range(self.size):
+            if active[i] and scores[i] != NEG_INF:
+                scores[i] += (rssi[i] - max_rssi) / self.rssi_scale
+        self._select_best()
+        if self.best is not None:
+            top = scores[self.best]
+            for i in range(self.size):
+                scores[i] -= top
+
+    def _select_best(self) -> None:
+        best = None
+        best_score = NEG_INF
+        for i in range(self.size):
+            if self.active[i] and self.scores[i] > best_score:
+                best = i
+                best_score = self.scores[i]
+        self.best = best
+
+    def _learn(self, previous: int | None) -> None:
+        """Update transition counts from decoded path."""
+        if previous is None or self.best is None:
+            return
+        if previous == self.best:
+            self.stays[previous] += 1
+        else:
+            self.leaves[previous] += 1
+        if self.stays[previous] + self.leaves[previous] > self.max_learned_steps:
+            self.stays[previous] = max(self.prior_stays, self.stays[previous] / 2)
+            self.leaves[previous] = max(self.prior_leaves, self.leaves[previous] / 2)
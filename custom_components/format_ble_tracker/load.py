@@ -0,0 +1,135 @@
+"""Event loop load monitoring implementation."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import logging
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .const import (
+    LOAD_LEVEL_NORMAL,
+    LOAD_LEVEL_TRANSITIONS_ONLY,
+    LOAD_LEVELS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class EventLoopLagMonitor:
+    """Measure event loop lag by checking, how late periodic probe is fired.
+
+    Lag is the same for the whole process, so load shedding level and its
+    threshold are kept here for all beacons.
+    """
+
+    interval = 1.0
+    alpha = 0.3
+    default_lag_threshold = 100
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize monitor."""
+        self.hass = hass
+        self.lag = 0.0
+        self.max_lag = 0.0
+        self.processing = 0.0
+        self.lag_threshold: int = self.default_lag_threshold
+        self.level = LOAD_LEVEL_NORMAL
+        self._expected = 0.0
+        self._timer: asyncio.TimerHandle | None = None
+        self._listeners = list[CALLBACK_TYPE]()
+        self._platforms = dict[str, dict[str, CALLBACK_TYPE]]()
+
+    @callback
+    def async_add_listener(self, level_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listen for load shedding level changes, probing while anybody listens."""
+        self._listeners.append(level_callback)
+        if self._timer is None:
+            self._schedule()
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(level_callback)
+            if not self._listeners and self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+        return remove_listener
+
+    @callback
+    def async_register_platform(
+        self, platform: str, entry_id: str, add_entity: Callable[[], None]
+    ) -> CALLBACK_TYPE:
+        """Register beacon platform, able to create load shedding entity.
+
+        Entity belongs to the first registered platform of its kind.
+        When it is unloaded, next one takes over and recreates it.
+        """
+        platforms = self._platforms.setdefault(platform, {})
+        if not platforms:
+            add_entity()
+        platforms[entry_id] = add_entity
+
+        @callback
+        def unregister() -> None:
+            was_owner = next(iter(platforms)) == entry_id
+            del platforms[entry_id]
+            if was_owner and platforms:
+                next(iter(platforms.values()))()
+
+        return unregister
+
+    def record_processing(self, value: float) -> None:
+        """Account time (in milliseconds) spent on processing one message."""
+        self.processing += self.alpha * (value - self.processing)
+
+    def set_lag_threshold(self, value: int) -> None:
+        """Set event loop lag threshold for the first load shedding level."""
+        self.lag_threshold = value
+        self._update_level()
+
+    def _schedule(self) -> None:
+        self._expected = self.hass.loop.time() + self.interval
+        self._timer = self.hass.loop.call_later(self.interval, self._probe)
+
+    @callback
+    def _probe(self) -> None:
+        lag = max(0.0, self.hass.loop.time() - self._expected) * 1000
+        self.lag += self.alpha * (lag - self.lag)
+        self.max_lag = max(self.max_lag, lag)
+        self._schedule()
+        self._update_level()
+
+    def _update_level(self) -> None:
+        """Set load shedding level from current lag.
+
+        Each next level requires twice higher lag, level is lowered back
+        when lag drops below half of its threshold.
+        """
+        threshold = self.lag_threshold
+        level = self.level
+        while level < LOAD_LEVEL_TRANSITIONS_ONLY and self.lag >= threshold * 2**level:
+            level += 1
+        if level == self.level:
+            while level > LOAD_LEVEL_NORMAL and self.lag < threshold * 2 ** (level - 2):
+                level -= 1
+        if level == self.level:
+            return
+        _LOGGER.info(
+            "Load shedding level changed to %s (event loop lag %.0f ms)",
+            LOAD_LEVELS[level],
+            self.lag,
+        )
+        self.level = level
+        for level_callback in list(self._listeners):
+            level_callback()
+
+    def as_dict(self) -> dict:
+        """Return summary of load."""
+        return {
+            "level": LOAD_LEVELS[self.level],
+            "lag_threshold_ms": self.lag_threshold,
+            "loop_lag_ms": round(self.lag, 3),
+            "max_loop_lag_ms": round(self.max_lag, 3),
+            "processing_ms": round(self.processing, 3),
+        }
@@ -7,7 +7,8 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .__init__ import BeaconCoordinator
 from .common import BeaconDeviceEntity
-from .const import DOMAIN
+from .const import DOMAIN, LOAD_MONITOR
+from .load import EventLoopLagMonitor
 
 
 async def async_setup_entry(
@@ -20,6 +21,15 @@ async def async_setup_entry(
         [BleDataExpirationNumber(coordinator), BleMinimumRssiNumber(coordinator)], True
     )
 
+    load_monitor: EventLoopLagMonitor = hass.data[DOMAIN][LOAD_MONITOR]
+    entry.async_on_unload(
+        load_monitor.async_register_platform(
+            input_number.DOMAIN,
+            entry.entry_id,
+            lambda: async_add_entities([BleLoadLagThresholdNumber(load_monitor)]),
+        )
+    )
+
 
 class BleDataExpirationNumber(BeaconDeviceEntity, RestoreNumber, NumberEntity):
     """Define expiration time number entity."""
@@ -97,3 +107,43 @@ class BleMinimumRssiNumber(BeaconDeviceEntity, RestoreNumber, NumberEntity):
         self._attr_native_value = value
         await self.coordinator.on_min_rssi_changed(value)
         self.async_write_ha_state()
+
+
+class BleLoadLagThresholdNumber(RestoreNumber, NumberEntity):
+    """Define integration-wide load shedding lag threshold number entity."""
+
+    _attr_should_poll = False
+
+    def __init__(self, load_monitor: EventLoopLagMonitor) -> None:
+        """Initialize."""
+        self.load_monitor = load_monitor
+        self._attr_name = "Format BLE Tracker load shedding threshold"
+        self._attr_mode = NumberMode.SLIDER
+        self._attr_native_unit_of_measurement = "ms"
+        self._attr_native_max_value = 1000
+        self._attr_native_min_value = 10
+        self._attr_native_step = 10
+        self._attr_unique_id = DOMAIN + "_load_lag_threshold"
+        self.entity_id = f"{input_number.DOMAIN}.{self._attr_unique_id}"
+
+    async def async_added_to_hass(self):
+        """Entity has been added to hass, restoring state."""
+        restored = await self.async_get_last_number_data()
+        native_value = (
+            self.load_monitor.default_lag_threshold
+            if restored is None
+            else restored.native_value
+        )
+        await self.update_value(native_value)
+
+    async def async_set_native_value(self, value: float) -> None:
+        """Update the current value."""
+        val = min(1000, max(10, int(value)))
+        await self.update_value(val)
+
+    async def update_value(self, value: int):
+        """Set value to HA and load monitor."""
+        self._attr_native_value = value
+        if value is not None:
+            self.load_monitor.set_lag_threshold(value)
+        self.async_write_ha_state()
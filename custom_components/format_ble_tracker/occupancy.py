@@ -0,0 +1,89 @@
+"""Room occupancy index implementation."""
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+
+class RoomOccupancyIndex:
+    """Reverse index of room to beacons present in it.
+
+    Coordinators report only room changes, so every update touches
+    at most two rooms, regardless of total beacons and rooms count.
+    """
+
+    def __init__(self) -> None:
+        """Initialize index."""
+        self.rooms = dict[str, dict[str, str]]()
+        self.beacon_rooms = dict[str, str]()
+        self._room_listeners = dict[str, list[CALLBACK_TYPE]]()
+        self._platforms = dict[str, Callable[[list[str]], None]]()
+
+    @callback
+    def async_move(self, mac: str, name: str, room: str | None) -> None:
+        """Move beacon to new room (or out of all rooms, if None)."""
+        old_room = self.beacon_rooms.get(mac)
+        if old_room == room:
+            return
+        if old_room is not None:
+            del self.beacon_rooms[mac]
+            del self.rooms[old_room][mac]
+            self._notify(old_room)
+        if room is not None:
+            self.beacon_rooms[mac] = room
+            if room not in self.rooms:
+                self.rooms[room] = {}
+                self._room_listeners[room] = []
+                if self._platforms:
+                    next(iter(self._platforms.values()))([room])
+            self.rooms[room][mac] = name
+            self._notify(room)
+
+    @callback
+    def async_remove_beacon(self, mac: str) -> None:
+        """Drop beacon from index."""
+        old_room = self.beacon_rooms.pop(mac, None)
+        if old_room is not None:
+            del self.rooms[old_room][mac]
+            self._notify(old_room)
+
+    @callback
+    def async_add_room_listener(
+        self, room: str, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for membership changes of room."""
+        listeners = self._room_listeners[room]
+        listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_register_platform(
+        self, entry_id: str, add_rooms: Callable[[list[str]], None]
+    ) -> CALLBACK_TYPE:
+        """Register sensor platform, able to create room entities.
+
+        Room entities belong to the first registered platform.
+        When it is unloaded, next one takes over and recreates them.
+        """
+        if not self._platforms:
+            add_rooms(list(self.rooms))
+        self._platforms[entry_id] = add_rooms
+
+        @callback
+        def unregister() -> None:
+            was_owner = next(iter(self._platforms)) == entry_id
+            del self._platforms[entry_id]
+            if was_owner and self._platforms:
+                next(iter(self._platforms.values()))(list(self.rooms))
+
+        return unregister
+
+    def _notify(self, room: str) -> None:
+        for update_callback in self._room_listeners[room]:
+            update_callback()
@@ -3,11 +3,22 @@ from homeassistant.components import sensor
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import slugify
 
 from .__init__ import BeaconCoordinator
 from .common import BeaconDeviceEntity
-from .const import DOMAIN
+from .const import (
+    DOMAIN,
+    LOAD_LEVEL_NO_ATTRIBUTES,
+    LOAD_LEVELS,
+    LOAD_MONITOR,
+    OCCUPANCY,
+    OCCUPANTS_SHOWN,
+)
+from .load import EventLoopLagMonitor
+from .occupancy import RoomOccupancyIndex
 
 
 async def async_setup_entry(
@@ -18,6 +29,27 @@ async def async_setup_entry(
     coordinator: BeaconCoordinator = hass.data[DOMAIN][entry.entry_id]
     async_add_entities([BleCurrentRoomSensor(coordinator)], True)
 
+    load_monitor: EventLoopLagMonitor = hass.data[DOMAIN][LOAD_MONITOR]
+    entry.async_on_unload(
+        load_monitor.async_register_platform(
+            sensor.DOMAIN,
+            entry.entry_id,
+            lambda: async_add_entities([BleLoadSheddingSensor(load_monitor)]),
+        )
+    )
+
+    occupancy: RoomOccupancyIndex = hass.data[DOMAIN][OCCUPANCY]
+
+    @callback
+    def add_rooms(rooms: list[str]) -> None:
+        entities: list[SensorEntity] = []
+        for room in rooms:
+            entities.append(BleRoomOccupancySensor(occupancy, room))
+            entities.append(BleRoomOccupantsSensor(occupancy, room))
+        async_add_entities(entities)
+
+    entry.async_on_unload(occupancy.async_register_platform(entry.entry_id, add_rooms))
+
 
 class BleCurrentRoomSensor(BeaconDeviceEntity, SensorEntity):
     """Define an room sensor entity."""
@@ -35,6 +67,11 @@ class BleCurrentRoomSensor(BeaconDeviceEntity, SensorEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle data update."""
+        if (
+            self.coordinator.load_level >= LOAD_LEVEL_NO_ATTRIBUTES
+            and self._attr_native_value == self.coordinator.room
+        ):
+            return
         self._attr_native_value = self.coordinator.room
         self.async_write_ha_state()
 
@@ -51,4 +88,103 @@ class BleCurrentRoomSensor(BeaconDeviceEntity, SensorEntity):
         for key, value in self.coordinator.room_data.items():
             attr["current_rooms_raw"][key] = f"{value} dBm"
         attr["last_adv"] = self.coordinator.time_from_previous
+        attr["current_rooms_expiration"] = {}
+        for key in self.coordinator.room_data:
+            expiration = self.coordinator.get_room_expiration_time(key)
+            attr["current_rooms_expiration"][key] = f"{round(expiration)} s"
         return attr
+
+
+class BleLoadSheddingSensor(SensorEntity):
+    """Define integration-wide load shedding level sensor entity."""
+
+    _attr_should_poll = False
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(self, load_monitor: EventLoopLagMonitor) -> None:
+        """Initialize."""
+        self.load_monitor = load_monitor
+        self._attr_name = "Format BLE Tracker load shedding"
+        self._attr_native_value = LOAD_LEVELS[load_monitor.level]
+        self._attr_unique_id = DOMAIN + "_load_shedding"
+        self.entity_id = f"{sensor.DOMAIN}.{self._attr_unique_id}"
+
+    async def async_added_to_hass(self) -> None:
+        """Register callbacks."""
+        self.async_on_remove(self.load_monitor.async_add_listener(self._handle_update))
+        self._attr_native_value = LOAD_LEVELS[self.load_monitor.level]
+
+    @callback
+    def _handle_update(self) -> None:
+        """Handle load shedding level change."""
+        self._attr_native_value = LOAD_LEVELS[self.load_monitor.level]
+        self.async_write_ha_state()
+
+
+class BleRoomSensor(SensorEntity):
+    """Base room sensor class, updated on room membership changes."""
+
+    _attr_should_poll = False
+
+    def __init__(self, occupancy: RoomOccupancyIndex, room: str) -> None:
+        """Initialize."""
+        self.occupancy = occupancy
+        self.room = room
+        self._update_from_index()
+
+    async def async_added_to_hass(self) -> None:
+        """Register callbacks."""
+        self.async_on_remove(
+            self.occupancy.async_add_room_listener(self.room, self._handle_update)
+        )
+        # Membership may have changed, while entity was being added
+        self._update_from_index()
+
+    @callback
+    def _handle_update(self) -> None:
+        """Handle room membership change."""
+        self._update_from_index()
+        self.async_write_ha_state()
+
+    def _update_from_index(self) -> None:
+        """Take values from occupancy index."""
+
+
+class BleRoomOccupancySensor(BleRoomSensor):
+    """Define room occupancy count sensor entity."""
+
+    def __init__(self, occupancy: RoomOccupancyIndex, room: str) -> None:
+        """Initialize."""
+        super().__init__(occupancy, room)
+        self._attr_name = room + " occupancy"
+        self._attr_native_unit_of_measurement = "beacons"
+        self._attr_unique_id = "room_" + slugify(room) + "_occupancy"
+        self.entity_id = f"{sensor.DOMAIN}.{DOMAIN}_{self._attr_unique_id}"
+
+    def _update_from_index(self) -> None:
+        """Take values from occupancy index."""
+        self._attr_native_value = len(self.occupancy.rooms[self.room])
+
+
+class BleRoomOccupantsSensor(BleRoomSensor):
+    """Define room occupants list sensor entity."""
+
+    def __init__(self, occupancy: RoomOccupancyIndex, room: str) -> None:
+        """Initialize."""
+        super().__init__(occupancy, room)
+        self._attr_name = room + " occupants"
+        self._attr_unique_id = "room_" + slugify(room) + "_occupants"
+        self.entity_id = f"{sensor.DOMAIN}.{DOMAIN}_{self._attr_unique_id}"
+
+    def _update_from_index(self) -> None:
+        """Take values from occupancy index."""
+        members = self.occupancy.rooms[self.room]
+        names = sorted(members.values())
+        state = ", ".join(names[:OCCUPANTS_SHOWN])
+        if len(names) > OCCUPANTS_SHOWN:
+            state += f" +{len(names) - OCCUPANTS_SHOWN} more"
+        # State is limited to 255 characters, full list is in attributes
+        self._attr_native_value = state[:255]
+        self._attr_extra_state_attributes = {
+            "beacons": {mac: members[mac] for mac in sorted(members)}
+        }
@@ -0,0 +1,129 @@
+"""Behavior switches implementation."""
+from typing import Any
+
+from homeassistant.components import switch
+from homeassistant.components.switch import SwitchEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import STATE_ON
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.restore_state import RestoreEntity
+
+from .__init__ import BeaconCoordinator
+from .common import BeaconDeviceEntity
+from .const import DOMAIN
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
+) -> None:
+    """Add switch entities from a config_entry."""
+
+    coordinator: BeaconCoordinator = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities(
+        [
+            BleAdaptiveExpirationSwitch(coordinator),
+            BleRoomEngineSwitch(coordinator),
+            BleLatencyTracingSwitch(coordinator),
+        ],
+        True,
+    )
+
+
+class BleAdaptiveExpirationSwitch(BeaconDeviceEntity, RestoreEntity, SwitchEntity):
+    """Define adaptive expiration switch entity."""
+
+    _attr_should_poll = False
+
+    def __init__(self, coordinator: BeaconCoordinator) -> None:
+        """Initialize."""
+        super().__init__(coordinator)
+        self._attr_name = coordinator.name + " adaptive expiration"
+        self._attr_is_on = False
+        self._attr_unique_id = self.formatted_mac_address + "_adaptive_expiration"
+        self.entity_id = f"{switch.DOMAIN}.{self._attr_unique_id}"
+
+    async def async_added_to_hass(self):
+        """Entity has been added to hass, restoring state."""
+        restored = await self.async_get_last_state()
+        await self.update_value(restored is not None and restored.state == STATE_ON)
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """Turn the switch on."""
+        await self.update_value(True)
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """Turn the switch off."""
+        await self.update_value(False)
+
+    async def update_value(self, value: bool):
+        """Set value to HA and coordinator."""
+        self._attr_is_on = value
+        await self.coordinator.on_adaptive_expiration_changed(value)
+        self.async_write_ha_state()
+
+
+class BleRoomEngineSwitch(BeaconDeviceEntity, RestoreEntity, SwitchEntity):
+    """Define probabilistic room engine switch entity."""
+
+    _attr_should_poll = False
+
+    def __init__(self, coordinator: BeaconCoordinator) -> None:
+        """Initialize."""
+        super().__init__(coordinator)
+        self._attr_name = coordinator.name + " probabilistic room engine"
+        self._attr_is_on = False
+        self._attr_unique_id = self.formatted_mac_address + "_room_engine"
+        self.entity_id = f"{switch.DOMAIN}.{self._attr_unique_id}"
+
+    async def async_added_to_hass(self):
+        """Entity has been added to hass, restoring state."""
+        restored = await self.async_get_last_state()
+        await self.update_value(restored is not None and restored.state == STATE_ON)
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """Turn the switch on."""
+        await self.update_value(True)
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """Turn the switch off."""
+        await self.update_value(False)
+
+    async def update_value(self, value: bool):
+        """Set value to HA and coordinator."""
+        self._attr_is_on = value
+        await self.coordinator.on_room_engine_changed(value)
+        self.async_write_ha_state()
+
+
+class BleLatencyTracingSwitch(BeaconDeviceEntity, RestoreEntity, SwitchEntity):
+    """Define latency tracing switch entity."""
+
+    _attr_should_poll = False
+
+    def __init__(self, coordinator: BeaconCoordinator) -> None:
+        """Initialize."""
+        super().__init__(coordinator)
+        self._attr_name = coordinator.name + " latency tracing"
+        self._attr_is_on = False
+        self._attr_unique_id = self.formatted_mac_address + "_latency_tracing"
+        self.entity_id = f"{switch.DOMAIN}.{self._attr_unique_id}"
+
+    async def async_added_to_hass(self):
+        """Entity has been added to hass, restoring state."""
+        restored = await self.async_get_last_state()
+        await self.update_value(restored is not None and restored.state == STATE_ON)
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """Turn the switch on."""
+        await self.update_value(True)
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """Turn the switch off."""
+        await self.update_value(False)
+
+    async def update_value(self, value: bool):
+        """Set value to HA and coordinator."""
+        self._attr_is_on = value
+        await self.coordinator.on_tracing_changed(value)
+        self.async_write_ha_state()
@@ -0,0 +1,92 @@
+"""Advert latency tracing implementation."""
+from __future__ import annotations
+
+import math
+
+STAGE_TRANSPORT = "transport"
+STAGE_DECODE = "decode"
+STAGE_FILTER = "filter"
+STAGE_STATE_WRITE = "state_write"
+STAGE_TOTAL = "total"
+STAGES = (STAGE_TRANSPORT, STAGE_DECODE, STAGE_FILTER, STAGE_STATE_WRITE, STAGE_TOTAL)
+# Stages, based on node timestamp with whole seconds precision
+COARSE_STAGES = (STAGE_TRANSPORT, STAGE_TOTAL)
+COARSE_RESOLUTION = 1000
+
+PERCENTILES = (50, 95, 99)
+
+
+class LatencyHistogram:
+    """Streaming histogram with logarithmic buckets (HDR style).
+
+    Values are kept in milliseconds with ~5% relative error,
+    recording is O(1) and memory is fixed at creation.
+    """
+
+    min_value = 0.001
+    max_value = 3_600_000.0
+    growth = 1.05
+
+    def __init__(self) -> None:
+        """Initialize histogram."""
+        self._log_growth = math.log(self.growth)
+        self.counts = [0] * (self._bucket(self.max_value) + 1)
+        self.total = 0
+        self.max = 0.0
+
+    def _bucket(self, value: float) -> int:
+        if value <= self.min_value:
+            return 0
+        return int(math.log(value / self.min_value) / self._log_growth) + 1
+
+    def record(self, value: float) -> None:
+        """Add value to histogram."""
+        self.counts[min(self._bucket(value), len(self.counts) - 1)] += 1
+        self.total += 1
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, percent: float) -> float | None:
+        """Return upper bound of bucket, containing given percentile."""
+        if self.total == 0:
+            return None
+        rank = math.ceil(self.total * percent / 100)
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(self.min_value * self.growth**index, self.max)
+        return self.max
+
+    def as_dict(self) -> dict:
+        """Return summary of histogram."""
+        summary = {"count": self.total}
+        for percent in PERCENTILES:
+            value = self.percentile(percent)
+            summary[f"p{percent}"] = None if value is None else round(value, 3)
+        summary["max"] = round(self.max, 3)
+        return summary
+
+
+class LatencyTracer:
+    """Histograms of latency per stage, optionally aggregated into parent tracer."""
+
+    def __init__(self, parent: LatencyTracer | None = None) -> None:
+        """Initialize tracer."""
+        self.parent = parent
+        self.histograms = {stage: LatencyHistogram() for stage in STAGES}
+
+    def record(self, stage: str, value: float) -> None:
+        """Record latency (in milliseconds) of stage."""
+        self.histograms[stage].record(value)
+        if self.parent is not None:
+            self.parent.record(stage, value)
+
+    def as_dict(self) -> dict:
+        """Return summary of all stages."""
+        summary = {}
+        for stage, histogram in self.histograms.items():
+            summary[stage] = histogram.as_dict()
+            if stage in COARSE_STAGES:
+                summary[stage]["resolution_ms"] = COARSE_RESOLUTION
+        return summary
@@ -0,0 +1,89 @@
+"""Tests for advert ordering and interval tracking."""
+import importlib.util
+from pathlib import Path
+
+# adverts.py has no Home Assistant dependencies, load it without the package
+_SPEC = importlib.util.spec_from_file_location(
+    "format_ble_tracker_adverts",
+    Path(__file__).parent.parent / "custom_components/format_ble_tracker/adverts.py",
+)
+adverts = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(adverts)
+
+ACCEPTED = adverts.AdvertOrderState.ACCEPTED
+DUPLICATE = adverts.AdvertOrderState.DUPLICATE
+STALE = adverts.AdvertOrderState.STALE
+MAX_GAP = 120
+
+
+def _check_seqs(order, seqs, timestamp=None):
+    return [order.check(seq, timestamp, -60, MAX_GAP) for seq in seqs]
+
+
+def test_seq_drops_duplicates_and_accepts_reordered():
+    """Test that redelivered adverts are dropped, but late ones pass once."""
+    order = adverts.AdvertOrderState()
+    assert _check_seqs(order, [1, 2, 2, 5, 4, 4, 3, 1]) == [
+        ACCEPTED,
+        ACCEPTED,
+        DUPLICATE,
+        ACCEPTED,
+        ACCEPTED,
+        DUPLICATE,
+        ACCEPTED,
+        DUPLICATE,
+    ]
+
+
+def test_seq_window_slides():
+    """Test that numbers far ahead reset the window."""
+    order = adverts.AdvertOrderState()
+    _check_seqs(order, range(10))
+    assert _check_seqs(order, [200, 190, 190]) == [ACCEPTED, ACCEPTED, DUPLICATE]
+
+
+def test_seq_restart_beyond_window():
+    """Test that node restart after many adverts is accepted at once."""
+    order = adverts.AdvertOrderState()
+    _check_seqs(order, range(500))
+    assert _check_seqs(order, range(5)) == [ACCEPTED] * 5
+
+
+def test_seq_restart_within_window_with_newer_timestamp():
+    """Test that node restart after few adverts is detected by timestamp."""
+    order = adverts.AdvertOrderState()
+    _check_seqs(order, range(40), timestamp=1000)
+    assert _check_seqs(order, [5], timestamp=1000) == [DUPLICATE]
+    assert _check_seqs(order, range(5), timestamp=1010) == [ACCEPTED] * 5
+    assert _check_seqs(order, [3], timestamp=1010) == [DUPLICATE]
+
+
+def test_timestamp_drops_repeated_latest_and_stale():
+    """Test timestamp-only ordering."""
+    order = adverts.AdvertOrderState()
+    assert order.check(None, 100, -60, MAX_GAP) == ACCEPTED
+    assert order.check(None, 100, -60, MAX_GAP) == DUPLICATE
+    assert order.check(None, 100, -62, MAX_GAP) == ACCEPTED
+    assert order.check(None, 99, -70, MAX_GAP) == STALE
+    assert order.check(None, 101, -60, MAX_GAP) == ACCEPTED
+
+
+def test_timestamp_recovers_from_bogus_future_value():
+    """Test that large backward jump is treated as clock correction."""
+    order = adverts.AdvertOrderState()
+    order.check(None, 100, -60, MAX_GAP)
+    order.check(None, 100000, -60, MAX_GAP)
+    assert order.check(None, 101, -60, MAX_GAP) == ACCEPTED
+    assert order.check(None, 102, -60, MAX_GAP) == ACCEPTED
+
+
+def test_interval_estimator_ignores_bursts():
+    """Test that buffered bursts do not pull the interval down."""
+    estimator = adverts.AdvertIntervalEstimator()
+    assert estimator.timeout(3) is None
+    for second in range(10):
+        estimator.update(second * 10.0)
+    assert estimator.timeout(3) == 30
+    for burst in range(5):
+        estimator.update(100 + burst * 0.1)
+    assert estimator.mean == 10
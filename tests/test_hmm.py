@@ -0,0 +1,81 @@
+"""Tests for the probabilistic room decision engine."""
+import importlib.util
+from pathlib import Path
+
+# hmm.py has no Home Assistant dependencies, load it without the package
+_SPEC = importlib.util.spec_from_file_location(
+    "format_ble_tracker_hmm",
+    Path(__file__).parent.parent / "custom_components/format_ble_tracker/hmm.py",
+)
+hmm = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(hmm)
+
+
+def _create_engine() -> hmm.RoomHmm:
+    return hmm.RoomHmm(0.95, 0.99, 6)
+
+
+def _readings_to_follow(engine: hmm.RoomHmm, strong: str, weak: str) -> int:
+    """Feed reading pairs with strong room 10 dB above weak, until room changes."""
+    for pairs in range(1, 100):
+        engine.update(weak, -70)
+        engine.update(strong, -60)
+        if engine.room == strong:
+            return pairs
+    return -1
+
+
+def test_follows_strongest_room():
+    """Test that room with clearly stronger signal is chosen."""
+    engine = _create_engine()
+    engine.update("kitchen", -60)
+    engine.update("bedroom", -80)
+    assert engine.room == "kitchen"
+
+
+def test_ignores_single_noisy_reading():
+    """Test that one spike in other room does not switch room."""
+    engine = _create_engine()
+    for _ in range(50):
+        engine.update("kitchen", -60)
+        engine.update("bedroom", -70)
+    engine.update("bedroom", -58)
+    assert engine.room == "kitchen"
+
+
+def test_room_switch_latency():
+    """Test that 10 dB move is followed in a couple of readings."""
+    engine = _create_engine()
+    for _ in range(50):
+        engine.update("kitchen", -60)
+        engine.update("bedroom", -70)
+    assert 0 < _readings_to_follow(engine, "bedroom", "kitchen") <= 3
+
+
+def test_long_dwell_keeps_transitions_bounded():
+    """Test that long stay in one room neither crashes nor slows down switching."""
+    engine = _create_engine()
+    engine.update("kitchen", -60)
+    engine.update("bedroom", -70)
+    kitchen = engine.room_index["kitchen"]
+    for _ in range(100000):
+        engine.update("kitchen", -60)
+    # Leaving count would decay to zero without the prior floor
+    engine.leaves[kitchen] = engine.prior_leaves
+    engine.stays[kitchen] = 1e300
+    engine.update("kitchen", -60)
+    assert engine.leaves[kitchen] >= engine.prior_leaves
+    assert engine.stay_probability_of(kitchen) <= 0.99
+    latency = _readings_to_follow(engine, "bedroom", "kitchen")
+    assert 0 < latency <= 3
+
+
+def test_removed_room_is_not_chosen():
+    """Test that room without data is never decoded."""
+    engine = _create_engine()
+    engine.update("kitchen", -60)
+    engine.update("bedroom", -80)
+    engine.remove("kitchen")
+    assert engine.room == "bedroom"
+    engine.remove("bedroom")
+    assert engine.room is None